@@ -2,30 +2,83 @@
 """
 tex_paper_toolkit is a library that simplifies export of values and texts into TeX format
 and can be used when analyzing/evaluating data for a paper.
+
+Submodules are only imported on first access of one of their attributes, which
+keeps the startup time of short-lived export scripts low.
 """
-from tex_paper_toolkit.mixins import (
-    ToolkitMixin,
-    AnyStringMixin,
-    TexString,
-    NewCommand,
-    NewCommandMixin,
-)
-from tex_paper_toolkit.serialization import Serializable, Serializer, SerTarget
-from tex_paper_toolkit.stringify import make_tex_identifier
-from tex_paper_toolkit.toolkit import TexToolkit, DefaultToolkit
+import importlib
+
 from tex_paper_toolkit.version import __version__
 
-__all__ = [
-    "__version__",
-    "ToolkitMixin",
-    "AnyStringMixin",
-    "TexString",
-    "NewCommand",
-    "NewCommandMixin",
-    "Serializable",
-    "Serializer",
-    "SerTarget",
-    "make_tex_identifier",
-    "TexToolkit",
-    "DefaultToolkit",
-]
+# avoids importing `typing` at runtime, type checkers treat this as `True`
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from tex_paper_toolkit.dataflow import DataflowGraph, DerivedCommand, DerivedMixin
+    from tex_paper_toolkit.mixins import (
+        ToolkitMixin,
+        AnyStringMixin,
+        TexString,
+        NewCommand,
+        NewCommandMixin,
+    )
+    from tex_paper_toolkit.plotdata import PlotData, PlotDataMixin
+    from tex_paper_toolkit.serialization import Serializable, Serializer, SerTarget
+    from tex_paper_toolkit.stats import QuantileSketch, StreamingStats, StatsMixin
+    from tex_paper_toolkit.stringify import make_tex_identifier
+    from tex_paper_toolkit.templates import TexTemplate, TemplateMixin, compile_template
+    from tex_paper_toolkit.toolkit import TexToolkit, DefaultToolkit
+    from tex_paper_toolkit.validation import TexValidationError, ValidationIssue
+
+_EXPORTS = {
+    "ToolkitMixin": "mixins",
+    "AnyStringMixin": "mixins",
+    "TexString": "mixins",
+    "NewCommand": "mixins",
+    "NewCommandMixin": "mixins",
+    "DataflowGraph": "dataflow",
+    "DerivedCommand": "dataflow",
+    "DerivedMixin": "dataflow",
+    "PlotData": "plotdata",
+    "PlotDataMixin": "plotdata",
+    "Serializable": "serialization",
+    "Serializer": "serialization",
+    "SerTarget": "serialization",
+    "QuantileSketch": "stats",
+    "StreamingStats": "stats",
+    "StatsMixin": "stats",
+    "TexTemplate": "templates",
+    "TemplateMixin": "templates",
+    "compile_template": "templates",
+    "make_tex_identifier": "stringify",
+    "TexToolkit": "toolkit",
+    "DefaultToolkit": "toolkit",
+    "TexValidationError": "validation",
+    "ValidationIssue": "validation",
+}
+"""
+Maps the public names of the package to the submodule that defines them.
+"""
+
+_SUBMODULES = frozenset(_EXPORTS.values()) | {"cli", "version"}
+
+__all__ = ["__version__", *_EXPORTS]
+
+
+def __getattr__(name: str) -> "Any":
+    if name in _EXPORTS:
+        module = importlib.import_module(f"{__name__}.{_EXPORTS[name]}")
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache the value so that subsequent accesses bypass this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_SUBMODULES})
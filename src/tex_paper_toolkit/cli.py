@@ -0,0 +1,334 @@
+"""
+Command-line entry point (`tex-paper-toolkit`) that runs declared export jobs.
+
+Jobs are declared in the `[tool.tex_paper_toolkit]` section of a
+`pyproject.toml` or at the top level of a standalone TOML file:
+
+    [tool.tex_paper_toolkit.jobs.results]
+    build = "scripts/results.py:build"  # or "package.module:build"
+    output = "generated/results.tex"
+    inputs = ["data/*.csv"]
+
+The `build` callable takes no arguments and returns a `TexToolkit` that is
+serialized to `output`. Paths are relative to the directory of the config
+file. Jobs whose build script and inputs are unchanged since their last
+successful run are skipped.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import importlib
+import importlib.util
+import json
+import sys
+import time
+import tomllib
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+DEFAULT_CONFIG = "pyproject.toml"
+
+DEFAULT_CACHE = ".tex_paper_toolkit_cache.json"
+
+
+class Job(NamedTuple):
+    """
+    A declared export job.
+    """
+
+    name: str
+    """The unique name of the job."""
+    build: str
+    """The build callable as `<script path or module>:<function>`."""
+    output: Path
+    """The default output file of the job."""
+    inputs: tuple[str, ...]
+    """Glob patterns of the input files the job depends on."""
+    base_dir: Path
+    """The directory relative to which paths are resolved."""
+
+
+def load_jobs(config_path: Path) -> tuple[list[Job], Path]:
+    """
+    Loads the declared jobs and the cache location from the given config file.
+
+    Parameters
+    ----------
+    config_path : Path
+        Either a `pyproject.toml` or a standalone TOML file.
+
+    Returns
+    -------
+    tuple[list[Job], Path]
+        The declared jobs and the path of the input hash cache.
+
+    Raises
+    ------
+    ValueError
+        If a job declaration is incomplete or invalid.
+    """
+    with open(config_path, "rb") as config_file:
+        config = tomllib.load(config_file)
+    if config_path.name == "pyproject.toml":
+        config = config.get("tool", {}).get("tex_paper_toolkit", {})
+
+    base_dir = config_path.resolve().parent
+    jobs = []
+    for name, job in config.get("jobs", {}).items():
+        if "build" not in job or "output" not in job:
+            raise ValueError("Job", name, "requires 'build' and 'output' entries")
+        inputs = tuple(job.get("inputs", ()))
+        for pattern in inputs:
+            # globbing only supports non-empty patterns relative to `base_dir`
+            if not isinstance(pattern, str) or not pattern or Path(pattern).anchor:
+                raise ValueError("Invalid input pattern", pattern, "of job", name)
+        jobs.append(Job(name, job["build"], base_dir / job["output"], inputs, base_dir))
+        _split_build(jobs[-1])
+    return jobs, base_dir / config.get("cache", DEFAULT_CACHE)
+
+
+def _split_build(job: Job) -> tuple[str, str]:
+    location, sep, function = job.build.rpartition(":")
+    if not sep or not location or not function:
+        raise ValueError("Invalid build callable", job.build, "of job", job.name)
+    return location, function
+
+
+def _add_to_path(base_dir: Path) -> None:
+    if str(base_dir) not in sys.path:
+        sys.path.insert(0, str(base_dir))
+
+
+def _build_script(job: Job) -> Optional[Path]:
+    location, _ = _split_build(job)
+    return job.base_dir / location if location.endswith(".py") else None
+
+
+def _build_source(job: Job) -> Optional[Path]:
+    script = _build_script(job)
+    if script is not None:
+        return script
+
+    # locates the module without executing it (only parent packages are imported)
+    _add_to_path(job.base_dir)
+    try:
+        spec = importlib.util.find_spec(_split_build(job)[0])
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.has_location or spec.origin is None:
+        return None
+    return Path(spec.origin)
+
+
+def input_hash(job: Job) -> str:
+    """
+    Computes a hash over the job declaration, the source file of its build
+    script or module and the contents of all its input files.
+
+    Parameters
+    ----------
+    job : Job
+        The job to hash.
+
+    Returns
+    -------
+    str
+        The hex digest identifying the current inputs of the job.
+    """
+    digest = hashlib.sha256(repr((job.build, str(job.output), job.inputs)).encode())
+
+    files = {path for pattern in job.inputs for path in job.base_dir.glob(pattern)}
+    source = _build_source(job)
+    if source is not None:
+        files.add(source)
+
+    for path in sorted(files):
+        if path.is_file():
+            # build modules may be installed outside of the base directory
+            name = (
+                path.relative_to(job.base_dir)
+                if path.is_relative_to(job.base_dir)
+                else path
+            )
+            digest.update(str(name).encode())
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _load_build(job: Job) -> Callable[[], Any]:
+    location, function = _split_build(job)
+    script = _build_script(job)
+    if script is not None:
+        spec = importlib.util.spec_from_file_location(f"_job_{job.name}", script)
+        if spec is None or spec.loader is None:
+            raise ImportError("Cannot load build script", script)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    else:
+        _add_to_path(job.base_dir)
+        if location in sys.modules:
+            # picks up changes of modules imported by previous jobs
+            module = importlib.reload(sys.modules[location])
+        else:
+            module = importlib.import_module(location)
+    return getattr(module, function)
+
+
+def run_job(job: Job) -> float:
+    """
+    Runs the given job, i.e., builds its toolkit and serializes it.
+    Relative paths used by the build callable are resolved against the
+    `base_dir` of the job.
+
+    Parameters
+    ----------
+    job : Job
+        The job to run.
+
+    Returns
+    -------
+    float
+        The duration of the job in seconds.
+    """
+    start = time.perf_counter()
+    with contextlib.chdir(job.base_dir):
+        toolkit = _load_build(job)()
+        job.output.parent.mkdir(parents=True, exist_ok=True)
+        toolkit.serialize(job.output)
+    return time.perf_counter() - start
+
+
+def _read_cache(path: Path) -> dict[str, str]:
+    try:
+        with open(path, "r", encoding="UTF-8") as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_cache(path: Path, cache: dict[str, str]) -> None:
+    with open(path, "w", encoding="UTF-8") as cache_file:
+        json.dump(cache, cache_file, indent=2, sort_keys=True)
+
+
+def _run_all(jobs: list[Job], parallel: int) -> Iterator[float | Exception]:
+    # pylint: disable=broad-exception-caught
+    if parallel > 1 and len(jobs) > 1:
+        # imported lazily as it is costly
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=parallel) as executor:
+            for future in [executor.submit(run_job, job) for job in jobs]:
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield e
+    else:
+        for job in jobs:
+            try:
+                yield run_job(job)
+            except Exception as e:
+                yield e
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="tex-paper-toolkit",
+        description="Runs the TeX export jobs declared in a config file.",
+    )
+    parser.add_argument(
+        "jobs", nargs="*", help="names of the jobs to run (default: all jobs)"
+    )
+    parser.add_argument(
+        "-c",
+        "--config",
+        type=Path,
+        default=Path(DEFAULT_CONFIG),
+        help=f"pyproject.toml or TOML file declaring the jobs (default: {DEFAULT_CONFIG})",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="number of jobs to run in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "-f", "--force", action="store_true", help="run jobs even if unchanged"
+    )
+    args = parser.parse_args(argv)
+    if args.parallel < 1:
+        parser.error("-j/--jobs must be at least 1")
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs the `tex-paper-toolkit` command line interface.
+
+    Parameters
+    ----------
+    argv : Sequence[str] | None (default: None)
+        The command line arguments (default: `sys.argv[1:]`).
+
+    Returns
+    -------
+    int
+        The exit code, i.e., 0 if all jobs succeeded and 1 otherwise.
+    """
+    args = _parse_args(argv)
+    try:
+        jobs, cache_path = load_jobs(args.config)
+    except (OSError, tomllib.TOMLDecodeError, ValueError) as e:
+        print(f"error: cannot load config {args.config}: {e}", file=sys.stderr)
+        return 2
+
+    unknown = set(args.jobs) - {job.name for job in jobs}
+    if unknown:
+        print(f"error: unknown jobs: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+    if args.jobs:
+        jobs = [job for job in jobs if job.name in args.jobs]
+
+    cache = _read_cache(cache_path)
+    pending: list[tuple[Job, str]] = []
+    for job in jobs:
+        digest = input_hash(job)
+        if not args.force and cache.get(job.name) == digest and job.output.exists():
+            print(f"{job.name}: skipped (unchanged)")
+        else:
+            pending.append((job, digest))
+
+    failed = 0
+    start = time.perf_counter()
+    for (job, digest), result in zip(
+        pending, _run_all([job for job, _ in pending], args.parallel)
+    ):
+        if isinstance(result, Exception):
+            failed += 1
+            cache.pop(job.name, None)
+            print(
+                f"{job.name}: failed ({type(result).__name__}: {result})",
+                file=sys.stderr,
+            )
+        else:
+            cache[job.name] = digest
+            print(f"{job.name}: done in {result:.2f}s")
+
+    if pending:
+        _write_cache(cache_path, cache)
+        print(
+            f"ran {len(pending) - failed}/{len(pending)} jobs "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
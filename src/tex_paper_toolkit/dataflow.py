@@ -0,0 +1,299 @@
+"""
+Module that enables the definition of derived TeX constants, i.e., constants
+whose values are computed from other registered constants (e.g., speedups or
+percentage deltas). Dependencies are tracked in a graph so that only affected
+values are recomputed when an input changes.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Optional, Self
+
+from tex_paper_toolkit.mixins import EscapeSettings, NewCommand, ToolkitMixin
+from tex_paper_toolkit.serialization import Serializable, SerTarget
+from tex_paper_toolkit.stringify import DigitSettings
+
+
+def command_id(label: str) -> str:
+    """
+    Returns the `Serializable.id` of the `NewCommand` (or subclass) with the
+    given label.
+
+    Parameters
+    ----------
+    label : str
+        The label of the `NewCommand`.
+
+    Returns
+    -------
+    str
+        The identifier under which the command is registered.
+    """
+    return f"{NewCommand.__name__}:{label}"
+
+
+class DerivedCommand(NewCommand):
+    """
+    A `NewCommand` whose value is computed from the values of other registered
+    `NewCommand`s (including subclasses such as `DerivedCommand`). Other
+    `Serializable`s cannot be used as inputs. The value is resolved via the
+    `DataflowGraph` of the toolkit the command is registered with.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        label: str,
+        function: Callable[..., Any],
+        inputs: Sequence[str],
+        comment: Optional[Any] = None,
+        mathmode: bool = True,
+        unit: str = "",
+        str_format: str = ".2f",
+        spell_digits: DigitSettings = False,
+        upcase_after_separator: bool = False,
+        to_file: Optional[SerTarget] = None,
+        escape: EscapeSettings = False,
+    ) -> None:
+        """
+        Creates a new serializable `DerivedCommand` component.
+
+        Parameters
+        ----------
+        label : str
+            The label that is used as a name to uniquely identify this generated
+            constant.
+
+        function : Callable[..., Any]
+            Computes the value of this constant. It is called with the values
+            of the `inputs` as positional arguments.
+
+        inputs : Sequence[str]
+            The labels of the `NewCommand`s this constant is derived from.
+            Each input must be registered as a `NewCommand` (or subclass).
+
+        str_format : str (default: ".2f")
+            The format specifier to use when embedding the computed value into
+            the generated TeX string.
+
+        For documentation on the remaining arguments, see the `NewCommand`
+        constructor.
+        """
+        super().__init__(
+            label,
+            None,
+            comment=comment,
+            mathmode=mathmode,
+            unit=unit,
+            str_format=str_format,
+            spell_digits=spell_digits,
+            upcase_after_separator=upcase_after_separator,
+            to_file=to_file,
+            escape=escape,
+        )
+        self.__function = function
+        self.__inputs = tuple(inputs)
+        self.__graph: Optional["DataflowGraph"] = None
+
+    @property
+    def function(self) -> Callable[..., Any]:
+        """
+        Returns the function that computes the value of this constant.
+        """
+        return self.__function
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        """
+        Returns the labels of the `NewCommand`s this constant is derived from.
+        """
+        return self.__inputs
+
+    @property
+    def value(self) -> Any:
+        if self.__graph is None:
+            raise ValueError(
+                "Derived command", self.key, "is not registered with a toolkit"
+            )
+        return self.__graph.value(self.id)
+
+    def bind(self, graph: "DataflowGraph") -> None:
+        """
+        Associates this command with the graph that resolves its value.
+        This is done by the toolkit upon registration.
+
+        Parameters
+        ----------
+        graph : DataflowGraph
+            The graph of the toolkit this command is registered with.
+        """
+        self.__graph = graph
+
+
+class DataflowGraph:
+    """
+    Dependency graph between registered `Serializable`s that memoizes the values
+    of `DerivedCommand`s and invalidates them when (transitive) inputs change.
+    """
+
+    def __init__(self, lookup: Callable[[str], Optional[Serializable]]) -> None:
+        """
+        Creates a new empty `DataflowGraph`.
+
+        Parameters
+        ----------
+        lookup : Callable[[str], Serializable | None]
+            Resolves a `Serializable.id` to the currently registered
+            `Serializable` (or `None` if there is none).
+        """
+        self.__lookup = lookup
+        self.__derived: dict[str, DerivedCommand] = {}
+        self.__dependents = defaultdict[str, set[str]](set)
+        self.__cache: dict[str, Any] = {}
+
+    def update(self, s: Serializable) -> None:
+        """
+        Updates the graph after `s` was registered, i.e., (re-)defines its
+        dependencies and invalidates all values that depend on it.
+
+        Parameters
+        ----------
+        s : Serializable
+            The newly registered `Serializable`.
+        """
+        previous = self.__derived.pop(s.id, None)
+        if previous is not None:
+            for input_id in map(command_id, previous.inputs):
+                self.__dependents[input_id].discard(s.id)
+
+        if isinstance(s, DerivedCommand):
+            input_ids = [command_id(label) for label in s.inputs]
+            if s.id in input_ids or not self.__downstream(s.id).isdisjoint(input_ids):
+                if previous is not None:
+                    self.update(previous)
+                raise ValueError("Cyclic dependency for derived command", s.key)
+            for input_id in input_ids:
+                self.__dependents[input_id].add(s.id)
+            self.__derived[s.id] = s
+            s.bind(self)
+
+        for node_id in self.__downstream(s.id) | {s.id}:
+            self.__cache.pop(node_id, None)
+
+    def value(self, node_id: str) -> Any:
+        """
+        Returns the value of the `NewCommand` with the given id.
+        Derived values are computed on first access and memoized until one of
+        their inputs changes.
+
+        Parameters
+        ----------
+        node_id : str
+            The `Serializable.id` of the command.
+
+        Returns
+        -------
+        Any
+            The (possibly derived) value of the command.
+        """
+        if node_id in self.__cache:
+            return self.__cache[node_id]
+
+        derived = self.__derived.get(node_id)
+        if derived is None:
+            target = self.__lookup(node_id)
+            if not isinstance(target, NewCommand):
+                raise KeyError("No command registered for input", node_id)
+            return target.value
+
+        args = [self.value(command_id(label)) for label in derived.inputs]
+        result = derived.function(*args)
+        self.__cache[node_id] = result
+        return result
+
+    def order(self, entries: Iterable[Serializable]) -> list[Serializable]:
+        """
+        Orders the given `Serializable`s such that the inputs of derived
+        commands precede them, otherwise preserving the given order.
+
+        Parameters
+        ----------
+        entries : Iterable[Serializable]
+            The `Serializable`s to order.
+
+        Returns
+        -------
+        list[Serializable]
+            The ordered `Serializable`s.
+        """
+        entries = list(entries)
+        pending = {s.id: s for s in entries}
+        ordered: list[Serializable] = []
+
+        def visit(s: Serializable) -> None:
+            if pending.pop(s.id, None) is None:
+                return
+            derived = self.__derived.get(s.id)
+            if derived is not None:
+                for input_id in map(command_id, derived.inputs):
+                    if input_id in pending:
+                        visit(pending[input_id])
+            ordered.append(s)
+
+        for s in entries:
+            visit(s)
+        return ordered
+
+    def __downstream(self, node_id: str) -> set[str]:
+        visited: set[str] = set()
+        stack = [node_id]
+        while stack:
+            for dependent in self.__dependents.get(stack.pop(), ()):
+                if dependent not in visited:
+                    visited.add(dependent)
+                    stack.append(dependent)
+        return visited
+
+
+class DerivedMixin(ToolkitMixin):
+    """
+    A toolkit mixin that enables definition of `DerivedCommand`s.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def derived(
+        self,
+        label: str,
+        function: Callable[..., Any],
+        inputs: Sequence[str],
+        comment: Any = None,
+        mathmode: bool = True,
+        unit: str = "",
+        str_format: str = ".2f",
+        spell_digits: DigitSettings = False,
+        upcase_after_separator=False,
+        to_file: Optional[SerTarget] = None,
+        escape: EscapeSettings = False,
+        command: DerivedCommand | None = None,
+    ) -> Self:
+        """
+        DSL method to register a `DerivedCommand`, either by passing an instance
+        directly or by providing the necessary arguments.
+        For documentation on the function's arguments, see the `DerivedCommand`
+        constructor.
+        """
+        if not command:
+            command = DerivedCommand(
+                label,
+                function,
+                inputs,
+                comment=comment,
+                mathmode=mathmode,
+                unit=unit,
+                str_format=str_format,
+                spell_digits=spell_digits,
+                upcase_after_separator=upcase_after_separator,
+                to_file=to_file,
+                escape=escape,
+            )
+        return self.add(command)
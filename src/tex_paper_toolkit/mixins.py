@@ -4,10 +4,24 @@ The default mixins offer support for defining Tex constants or simply
 serializing strings.
 """
 
-from typing import Any, Self, Optional, Protocol
-from tex_paper_toolkit.stringify import DigitSettings, make_tex_identifier
+from collections.abc import Collection
+from typing import Any, Literal, Self, Optional, Protocol
+from tex_paper_toolkit.stringify import DigitSettings, escape_tex, make_tex_identifier
 from tex_paper_toolkit.serialization import Serializable, SerTarget
 
+EscapedField = Literal["value", "unit", "comment"]
+
+EscapeSettings = bool | Collection[EscapedField]
+"""
+Either escape the `value` and `comment` (`True`) or no (`False`) fields of a
+`NewCommand` or only the specified ones.
+"""
+
+ESCAPED_FIELDS = frozenset(("value", "unit", "comment"))
+"""
+The fields of a `NewCommand` that can be escaped.
+"""
+
 
 # pylint: # pylint: disable=too-few-public-methods
 class ToolkitMixin(Protocol):
@@ -33,6 +47,7 @@ class ToolkitMixin(Protocol):
         """
 
 
+# pylint: disable=too-many-instance-attributes
 class NewCommand(Serializable):
     """
     Defines a serializable TeX constant definition (\\newcommand{<label>}{<value>}).
@@ -50,6 +65,7 @@ class NewCommand(Serializable):
         spell_digits: DigitSettings = False,
         upcase_after_separator: bool = False,
         to_file: Optional[SerTarget] = None,
+        escape: EscapeSettings = False,
     ) -> None:
         """
         Creates a new serializable `NewCommand` component.
@@ -88,6 +104,15 @@ class NewCommand(Serializable):
 
         to_file : str | Path | Serializer | None (default: None)
             Optional serialization target.
+
+        escape : bool | Collection["value" | "unit" | "comment"] (default: False)
+            Escapes TeX special characters (e.g., `_`, `%` or `&`) in the
+            specified fields upon serialization. `True` escapes `value` and
+            `comment`, the `unit` is usually TeX already (e.g., `\\%`) and has
+            to be listed explicitly. Note that `\\`, `~` and `^` are escaped
+            via text-mode commands (e.g., `\\textbackslash{}`), which are invalid
+            within math mode, i.e., combine with `mathmode=False` for values
+            containing these characters.
         """
         super().__init__(label, to_file)
         self.__value = value
@@ -97,13 +122,53 @@ class NewCommand(Serializable):
         self.__str_format = str_format
         self.__spell_digits = spell_digits
         self.__upcase_after_separator = upcase_after_separator
+        if isinstance(escape, str):
+            raise ValueError("Escaped fields must be a collection of names", escape)
+        self.__escape: frozenset[str] = (
+            frozenset(("value", "comment"))
+            if escape is True
+            else frozenset(escape or ())
+        )
+        if not self.__escape <= ESCAPED_FIELDS:
+            raise ValueError(
+                "Unknown escaped fields", sorted(self.__escape - ESCAPED_FIELDS)
+            )
+
+    @property
+    def value(self) -> Any:
+        """
+        Returns the (unformatted) value of this TeX constant.
+
+        Returns
+        -------
+        Any
+            The value that is embedded upon serialization.
+        """
+        return self.__value
+
+    @property
+    def id(self) -> str:
+        # subclasses (e.g., derived constants) with the same label define the
+        # same macro and are looked up by label
+        return f"{NewCommand.__name__}:{self.key}"
 
     def serialize(self) -> str:
-        value_str = f"{self.__value:{self.__str_format}}{self.__unit}"
+        value_str = f"{self.value:{self.__str_format}}"
+        unit = self.__unit
+        comment = self.__comment
+        if self.__escape:
+            if "value" in self.__escape:
+                value_str = escape_tex(value_str)
+            if "unit" in self.__escape:
+                unit = escape_tex(unit)
+            if comment and "comment" in self.__escape:
+                comment = escape_tex(str(comment))
+
+        value_str = f"{value_str}{unit}"
         if self.__mathmode:
             value_str = f"${value_str}$"
 
-        suffix = f" % {self.__comment}" if self.__comment else ""
+        suffix = f" % {comment}" if comment else ""
 
         label = make_tex_identifier(
             self.key, self.__spell_digits, self.__upcase_after_separator
@@ -129,6 +194,7 @@ class NewCommandMixin(ToolkitMixin):
         spell_digits: DigitSettings = False,
         upcase_after_separator=False,
         to_file: Optional[SerTarget] = None,
+        escape: EscapeSettings = False,
         command: NewCommand | None = None,
     ) -> Self:
         """
@@ -148,6 +214,7 @@ class NewCommandMixin(ToolkitMixin):
                 spell_digits,
                 upcase_after_separator,
                 to_file,
+                escape,
             )
         return self.add(command)
 
@@ -158,7 +225,11 @@ class TexString(Serializable):
     """
 
     def __init__(
-        self, key: Any, tex_str: str, to_file: Optional[SerTarget] = None
+        self,
+        key: Any,
+        tex_str: str,
+        to_file: Optional[SerTarget] = None,
+        escape: bool = False,
     ) -> None:
         """
         Creates a new serializable `TexString`.
@@ -169,15 +240,19 @@ class TexString(Serializable):
             The unique key that should identify this particular `TexString`.
         tex_str : str
             The TeX string. This has to be a valid TeX string as it will be
-            serialized "as-is".
+            serialized "as-is" (unless `escape` is set).
         to_file : str | Path | Serializer | None (default: None)
             Optional serialization target.
+        escape : bool (default: False)
+            Escapes TeX special characters so that the string is typeset
+            verbatim.
         """
         super().__init__(key, to_file)
         self.__tex_str = tex_str
+        self.__escape = escape
 
     def serialize(self) -> str:
-        return self.__tex_str
+        return escape_tex(self.__tex_str) if self.__escape else self.__tex_str
 
 
 class AnyStringMixin(ToolkitMixin):
@@ -190,16 +265,17 @@ class AnyStringMixin(ToolkitMixin):
         label: str,
         tex_str: str | TexString,
         to_file: Optional[SerTarget] = None,
+        escape: bool = False,
     ) -> Self:
         """
         DSL method to register a `TexString`, either by passing an instance directly
         or by providing the necessary arguments.
-        For documentation on the function's arguments, see the `NewCommand`
+        For documentation on the function's arguments, see the `TexString`
         constructor.
         """
         elem = (
             tex_str
             if isinstance(tex_str, TexString)
-            else TexString(label, tex_str, to_file)
+            else TexString(label, tex_str, to_file, escape)
         )
         return self.add(elem)
@@ -0,0 +1,317 @@
+"""
+Module for exporting (large) data series as coordinate files for pgfplots
+(e.g., `\\addplot table {data.dat};`). Series are downsampled to a point budget
+while preserving their shape, and unchanged series are not processed again.
+"""
+
+import hashlib
+from array import array
+from collections.abc import Iterable, Sequence
+from itertools import repeat
+from operator import add, mul
+from pathlib import Path
+from typing import Any, Literal, Optional, Self
+
+from tex_paper_toolkit.mixins import ToolkitMixin
+from tex_paper_toolkit.serialization import Serializable
+
+DownsamplingMethod = Literal["lttb", "minmax"]
+
+HEADER_PREFIX = "# tex_paper_toolkit plot data sha256="
+"""
+Prefix of the first line of generated coordinate files, which is followed by
+the hash of the data and settings the file was generated from. pgfplots treats
+lines starting with `#` as comments.
+"""
+
+
+def _as_floats(values: Iterable[Any]) -> array:
+    # `tolist` converts numpy arrays or pandas series efficiently
+    tolist = getattr(values, "tolist", None)
+    return array("d", tolist() if callable(tolist) else values)
+
+
+def _largest_triangle(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    a: tuple[float, float],
+    c: tuple[float, float],
+    candidates: slice,
+) -> int:
+    (ax, ay), (cx, cy) = a, c
+    dx, dy = ax - cx, cy - ay
+    # the triangle area is proportional to |dx * y + dy * x - offset|, which
+    # is largest for either the maximum or the minimum of the signed terms
+    offset = dx * ay + dy * ax
+    signed = list(
+        map(
+            add,
+            map(mul, repeat(dx), ys[candidates]),
+            map(mul, repeat(dy), xs[candidates]),
+        )
+    )
+    hi, lo = max(signed), min(signed)
+    return candidates.start + signed.index(hi if hi - offset >= offset - lo else lo)
+
+
+def lttb(xs: Sequence[float], ys: Sequence[float], max_points: int) -> list[int]:
+    """
+    Selects the indices of at most `max_points` points with the
+    Largest-Triangle-Three-Buckets algorithm, which preserves the visual shape
+    of a series.
+
+    Parameters
+    ----------
+    xs : Sequence[float]
+        The (ascending) x coordinates.
+    ys : Sequence[float]
+        The y coordinates.
+    max_points : int
+        The point budget (at least 3).
+
+    Returns
+    -------
+    list[int]
+        The ascending indices of the selected points.
+    """
+    if max_points < 3:
+        raise ValueError("Point budget must be at least 3", max_points)
+    n = len(xs)
+    if n <= max_points:
+        return list(range(n))
+
+    every = (n - 2) / (max_points - 2)
+    selected = 0
+    indices = [0]
+    for bucket in range(max_points - 2):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, n)
+
+        avg_x = sum(xs[end:next_end]) / (next_end - end)
+        avg_y = sum(ys[end:next_end]) / (next_end - end)
+        selected = _largest_triangle(
+            xs, ys, (xs[selected], ys[selected]), (avg_x, avg_y), slice(start, end)
+        )
+        indices.append(selected)
+    indices.append(n - 1)
+    return indices
+
+
+def minmax(ys: Sequence[float], max_points: int) -> list[int]:
+    """
+    Selects the indices of at most `max_points` points by keeping the minimum
+    and maximum of equally sized buckets (as well as the first and last point),
+    which preserves the extrema of a series.
+
+    Parameters
+    ----------
+    ys : Sequence[float]
+        The y coordinates.
+    max_points : int
+        The point budget (at least 4).
+
+    Returns
+    -------
+    list[int]
+        The ascending indices of the selected points.
+    """
+    if max_points < 4:
+        raise ValueError("Point budget must be at least 4", max_points)
+    n = len(ys)
+    if n <= max_points:
+        return list(range(n))
+
+    buckets = (max_points - 2) // 2
+    size = (n - 2) / buckets
+    indices = [0]
+    for bucket in range(buckets):
+        start = int(bucket * size) + 1
+        segment = ys[start : int((bucket + 1) * size) + 1]
+        lo = start + segment.index(min(segment))
+        hi = start + segment.index(max(segment))
+        indices.extend(sorted({lo, hi}))
+    indices.append(n - 1)
+    return indices
+
+
+# pylint: disable=too-many-instance-attributes
+class PlotData(Serializable):
+    """
+    A serializable coordinate table that is written to its own file, which can
+    be used as pgfplots table input.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        key: Any,
+        path: str | Path,
+        x: Iterable[Any],
+        y: Iterable[Any],
+        max_points: Optional[int] = 1000,
+        method: DownsamplingMethod = "lttb",
+        str_format: str = ".6g",
+        columns: tuple[str, str] = ("x", "y"),
+        x_format: str = "",
+    ) -> None:
+        """
+        Creates a new serializable `PlotData` component.
+
+        Parameters
+        ----------
+        key : Any
+            The unique key that should identify this particular `PlotData`.
+        path : str | Path
+            The coordinate file this data is written to.
+        x : Iterable[Any]
+            The (ascending) x coordinates, e.g., a list or a numpy array.
+        y : Iterable[Any]
+            The y coordinates. Must have the same length as `x`.
+        max_points : int | None (default: 1000)
+            The maximum number of points that are written (at least 4, so
+            that both methods apply). If `None`, all points are written.
+        method : "lttb" | "minmax" (default: "lttb")
+            The downsampling method (see `lttb` and `minmax`).
+        str_format : str (default: ".6g")
+            The format specifier for the y coordinates.
+        columns : tuple[str, str] (default: ("x", "y"))
+            The column names of the table.
+        x_format : str (default: "")
+            The format specifier for the x coordinates. By default, the
+            shortest representation that is exact is written, so that large x
+            coordinates (e.g., timestamps) are not rounded.
+        """
+        super().__init__(key, write_plot_data)
+        if method not in ("lttb", "minmax"):
+            raise ValueError("Unknown downsampling method", method)
+        if max_points is not None and max_points < 4:
+            raise ValueError("Point budget must be at least 4", max_points)
+
+        self.__path = Path(path)
+        self.__xs = _as_floats(x)
+        self.__ys = _as_floats(y)
+        if len(self.__xs) != len(self.__ys):
+            raise ValueError(
+                "Coordinate lengths differ", len(self.__xs), len(self.__ys)
+            )
+        self.__max_points = max_points
+        self.__method = method
+        self.__row_format = f"{{:{x_format}}} {{:{str_format}}}"
+        self.__columns = columns
+        self.__hash: Optional[str] = None
+        self.__serialized: Optional[str] = None
+
+    @property
+    def path(self) -> Path:
+        """
+        Returns the coordinate file this data is written to.
+        """
+        return self.__path
+
+    @property
+    def input_hash(self) -> str:
+        """
+        Returns a hash of the coordinates and settings, which identifies the
+        generated file contents.
+
+        Returns
+        -------
+        str
+            The hex digest of the inputs.
+        """
+        if self.__hash is None:
+            digest = hashlib.sha256(
+                repr(
+                    (
+                        self.__max_points,
+                        self.__method,
+                        self.__row_format,
+                        self.__columns,
+                    )
+                ).encode()
+            )
+            digest.update(self.__xs.tobytes())
+            digest.update(self.__ys.tobytes())
+            self.__hash = digest.hexdigest()
+        return self.__hash
+
+    def downsample(self) -> list[int]:
+        """
+        Selects the indices of the points that are written.
+
+        Returns
+        -------
+        list[int]
+            The ascending indices of the selected points.
+        """
+        if self.__max_points is None:
+            return list(range(len(self.__xs)))
+        if self.__method == "minmax":
+            return minmax(self.__ys, self.__max_points)
+        return lttb(self.__xs, self.__ys, self.__max_points)
+
+    def serialize(self) -> str:
+        if self.__serialized is None:
+            indices = self.downsample()
+            xs, ys = self.__xs, self.__ys
+            rows = map(
+                self.__row_format.format,
+                [xs[i] for i in indices],
+                [ys[i] for i in indices],
+            )
+            self.__serialized = "\n".join(
+                [f"{HEADER_PREFIX}{self.input_hash}", " ".join(self.__columns), *rows]
+            )
+        return self.__serialized
+
+
+def write_plot_data(plot: PlotData) -> None:
+    """
+    Serializer for `PlotData` that writes its coordinate file, unless the
+    file was already generated from the same inputs.
+
+    Parameters
+    ----------
+    plot : PlotData
+        The plot data to write.
+    """
+    header = f"{HEADER_PREFIX}{plot.input_hash}"
+    if plot.path.is_file():
+        with open(plot.path, "r", encoding="UTF-8") as existing:
+            if existing.readline().rstrip("\n") == header:
+                return
+
+    plot.path.parent.mkdir(parents=True, exist_ok=True)
+    with open(plot.path, "w", encoding="UTF-8") as outfile:
+        outfile.write(plot.serialize() + "\n")
+
+
+class PlotDataMixin(ToolkitMixin):
+    """
+    A toolkit mixin that enables export of (downsampled) pgfplots data files.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def plotdata(
+        self,
+        label: str,
+        path: str | Path,
+        x: Iterable[Any],
+        y: Iterable[Any],
+        max_points: Optional[int] = 1000,
+        method: DownsamplingMethod = "lttb",
+        str_format: str = ".6g",
+        columns: tuple[str, str] = ("x", "y"),
+        x_format: str = "",
+    ) -> Self:
+        """
+        DSL method to register a `PlotData` coordinate file.
+        For documentation on the function's arguments, see the `PlotData`
+        constructor.
+        """
+        return self.add(
+            PlotData(
+                label, path, x, y, max_points, method, str_format, columns, x_format
+            )
+        )
@@ -0,0 +1,478 @@
+"""
+Module for computing summary statistics over large sample sets in a single
+streaming pass and registering them as TeX constants.
+Partial results (e.g., from different workers) can be merged before
+registration.
+"""
+
+import math
+from collections.abc import Iterable, Iterator
+from itertools import chain, islice
+from numbers import Real
+from typing import Any, Optional, Self
+
+from tex_paper_toolkit.mixins import NewCommand, ToolkitMixin
+from tex_paper_toolkit.serialization import SerTarget
+from tex_paper_toolkit.stringify import DigitSettings
+
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+"""
+Number of scalar samples that are buffered before they are folded into the
+statistics when consuming a flat stream of values.
+"""
+
+_EMPTY = object()
+"""
+Sentinel for an exhausted stream, which (unlike `None`) is never a sample.
+"""
+
+
+class QuantileSketch:
+    """
+    A mergeable quantile sketch with bounded memory.
+    Samples are stored in a hierarchy of buffers where an item at level `i`
+    represents `2^i` original samples. Whenever a buffer exceeds the capacity,
+    it is sorted and every other item is promoted to the next level.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        """
+        Creates a new empty `QuantileSketch`.
+
+        Parameters
+        ----------
+        capacity : int (default: 256)
+            The maximum number of items per level. Larger capacities yield more
+            accurate quantiles at the cost of memory.
+        """
+        if capacity < 2:
+            raise ValueError("Sketch capacity must be at least 2", capacity)
+        self.__capacity = capacity
+        self.__levels: list[list[float]] = [[]]
+        self.__compactions = 0
+
+    @property
+    def count(self) -> int:
+        """
+        Returns the number of samples summarized by this sketch.
+
+        Returns
+        -------
+        int
+            The (exact) number of samples added to this sketch.
+        """
+        return sum(len(items) << level for level, items in enumerate(self.__levels))
+
+    def update(self, values: Iterable[float]) -> Self:
+        """
+        Adds the given samples to this sketch.
+
+        Parameters
+        ----------
+        values : Iterable[float]
+            The samples to add.
+
+        Returns
+        -------
+        Self
+            This sketch object.
+        """
+        self.__levels[0].extend(values)
+        self.__compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> Self:
+        """
+        Merges the samples summarized by another sketch into this sketch.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            The sketch to merge. It is not modified.
+
+        Returns
+        -------
+        Self
+            This sketch object.
+        """
+        # pylint: disable=protected-access
+        for level, items in enumerate(other.__levels):
+            if level == len(self.__levels):
+                self.__levels.append([])
+            self.__levels[level].extend(items)
+        self.__compress()
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates the `q`-quantile of the summarized samples.
+        Values between the ranks of stored items are linearly interpolated,
+        which is exact as long as no compaction happened.
+
+        Parameters
+        ----------
+        q : float
+            The quantile to compute, within [0, 1].
+
+        Returns
+        -------
+        float
+            The estimated quantile.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be within [0, 1]", q)
+        weighted = sorted(
+            chain.from_iterable(
+                ((item, 1 << level) for item in items)
+                for level, items in enumerate(self.__levels)
+            )
+        )
+        if not weighted:
+            raise ValueError("Cannot compute quantiles of an empty sketch")
+
+        target = q * (self.count - 1)
+        rank = 0
+        prev_item, prev_center = weighted[0][0], 0.0
+        for item, weight in weighted:
+            center = rank + (weight - 1) / 2
+            if center >= target:
+                if center == prev_center:
+                    return item
+                fraction = max(0.0, (target - prev_center) / (center - prev_center))
+                return prev_item + (item - prev_item) * fraction
+            prev_item, prev_center = item, center
+            rank += weight
+        return prev_item
+
+    def __compress(self) -> None:
+        level = 0
+        while level < len(self.__levels):
+            items = self.__levels[level]
+            if len(items) > self.__capacity:
+                items.sort()
+                # keep one item back for odd lengths so that weights stay exact
+                leftover = items[-1:] if len(items) % 2 else []
+                paired = items[: len(items) - len(leftover)]
+                # alternate the offset to avoid systematically biasing the result
+                offset = self.__compactions % 2
+                self.__compactions += 1
+                if level + 1 == len(self.__levels):
+                    self.__levels.append([])
+                self.__levels[level + 1].extend(paired[offset::2])
+                self.__levels[level] = leftover
+            level += 1
+
+
+class StreamingStats:
+    """
+    Accumulates summary statistics (count, mean, variance, extrema and
+    quantiles) over a stream of samples in a single pass.
+    """
+
+    def __init__(self, sketch_capacity: int = 256) -> None:
+        """
+        Creates a new empty `StreamingStats` accumulator.
+
+        Parameters
+        ----------
+        sketch_capacity : int (default: 256)
+            The capacity of the underlying `QuantileSketch`.
+        """
+        self.__count = 0
+        self.__mean = 0.0
+        self.__m2 = 0.0
+        self.__min = math.inf
+        self.__max = -math.inf
+        self.__sketch = QuantileSketch(sketch_capacity)
+
+    def update(self, chunk: Iterable[Any]) -> Self:
+        """
+        Folds a chunk of samples (e.g., a list or an array) into the statistics.
+
+        Parameters
+        ----------
+        chunk : Iterable[Any]
+            The samples to add. Each sample must be convertible to `float`.
+
+        Returns
+        -------
+        Self
+            This accumulator object.
+        """
+        values = list(map(float, chunk))
+        if not values:
+            return self
+
+        n = len(values)
+        mean = math.fsum(values) / n
+        m2 = math.fsum((v - mean) ** 2 for v in values)
+        self.__combine(n, mean, m2, min(values), max(values))
+        self.__sketch.update(values)
+        return self
+
+    def consume(
+        self, data: Iterable[Any], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Self:
+        """
+        Folds all samples of the given stream into the statistics.
+        The stream may either yield scalar samples, which are buffered in chunks
+        of `chunk_size`, or chunks of samples (e.g., arrays read from disk).
+
+        Parameters
+        ----------
+        data : Iterable[Any]
+            Either an iterable of scalars or an iterable of sample chunks.
+        chunk_size : int (default: 65536)
+            The number of buffered scalars per chunk.
+
+        Returns
+        -------
+        Self
+            This accumulator object.
+        """
+        it = iter(data)
+        first = next(it, _EMPTY)
+        if first is _EMPTY:
+            return self
+
+        if isinstance(first, Real):
+            it = chain((first,), it)
+            while chunk := list(islice(it, chunk_size)):
+                self.update(chunk)
+        else:
+            for chunk in chain((first,), it):
+                self.update(chunk)
+        return self
+
+    def merge(self, other: "StreamingStats") -> Self:
+        """
+        Merges the statistics of another accumulator (e.g., computed by a
+        different worker) into this accumulator.
+
+        Parameters
+        ----------
+        other : StreamingStats
+            The accumulator to merge. It is not modified.
+
+        Returns
+        -------
+        Self
+            This accumulator object.
+        """
+        # pylint: disable=protected-access
+        if other.__count:
+            self.__combine(
+                other.__count, other.__mean, other.__m2, other.__min, other.__max
+            )
+            self.__sketch.merge(other.__sketch)
+        return self
+
+    @property
+    def count(self) -> int:
+        """
+        Returns the number of samples.
+        """
+        return self.__count
+
+    @property
+    def mean(self) -> float:
+        """
+        Returns the arithmetic mean of the samples.
+        """
+        self.__require_samples()
+        return self.__mean
+
+    @property
+    def variance(self) -> float:
+        """
+        Returns the (unbiased) sample variance.
+        """
+        if self.__count < 2:
+            raise ValueError("Variance requires at least two samples")
+        return self.__m2 / (self.__count - 1)
+
+    @property
+    def stddev(self) -> float:
+        """
+        Returns the sample standard deviation.
+        """
+        return math.sqrt(self.variance)
+
+    @property
+    def minimum(self) -> float:
+        """
+        Returns the smallest sample.
+        """
+        self.__require_samples()
+        return self.__min
+
+    @property
+    def maximum(self) -> float:
+        """
+        Returns the largest sample.
+        """
+        self.__require_samples()
+        return self.__max
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates the `q`-quantile of the samples (exact for the extrema and as
+        long as the sketch capacity was not exceeded).
+
+        Parameters
+        ----------
+        q : float
+            The quantile to compute, within [0, 1].
+
+        Returns
+        -------
+        float
+            The estimated quantile.
+        """
+        self.__require_samples()
+        if q == 0:
+            return self.__min
+        if q == 1:
+            return self.__max
+        return min(max(self.__sketch.quantile(q), self.__min), self.__max)
+
+    def confidence_interval(self, confidence: float = 0.95) -> tuple[float, float]:
+        """
+        Computes the confidence interval of the mean using the normal
+        approximation, which is appropriate for large sample sizes.
+
+        Parameters
+        ----------
+        confidence : float (default: 0.95)
+            The confidence level, within (0, 1).
+
+        Returns
+        -------
+        tuple[float, float]
+            The lower and upper bound of the interval.
+        """
+        # imported lazily as it is costly
+        # pylint: disable=import-outside-toplevel
+        from statistics import NormalDist
+
+        if not 0 < confidence < 1:
+            raise ValueError("Confidence must be within (0, 1)", confidence)
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        margin = z * self.stddev / math.sqrt(self.__count)
+        return self.__mean - margin, self.__mean + margin
+
+    def metric(self, name: str, confidence: float = 0.95) -> float:
+        """
+        Returns the statistic identified by the given name.
+        Supported names are `count`, `mean`, `variance`, `stddev`, `min`, `max`,
+        `median`, `p<percentile>` (e.g., `p95` or `p99.9`), `ci-lower` and
+        `ci-upper`.
+
+        Parameters
+        ----------
+        name : str
+            The name of the statistic.
+        confidence : float (default: 0.95)
+            The confidence level used for `ci-lower` and `ci-upper`.
+
+        Returns
+        -------
+        float
+            The value of the statistic.
+        """
+        simple = {
+            "count": lambda: self.count,
+            "mean": lambda: self.mean,
+            "variance": lambda: self.variance,
+            "stddev": lambda: self.stddev,
+            "min": lambda: self.minimum,
+            "max": lambda: self.maximum,
+            "median": lambda: self.quantile(0.5),
+            "ci-lower": lambda: self.confidence_interval(confidence)[0],
+            "ci-upper": lambda: self.confidence_interval(confidence)[1],
+        }
+        if name in simple:
+            return simple[name]()
+        if name.startswith("p"):
+            try:
+                percentile = float(name[1:])
+            except ValueError:
+                pass
+            else:
+                return self.quantile(percentile / 100)
+        raise ValueError("Unknown statistic", name)
+
+    def __combine(self, n: int, mean: float, m2: float, lo: float, hi: float) -> None:
+        total = self.__count + n
+        delta = mean - self.__mean
+        self.__mean += delta * n / total
+        self.__m2 += m2 + delta**2 * self.__count * n / total
+        self.__count = total
+        self.__min = min(self.__min, lo)
+        self.__max = max(self.__max, hi)
+
+    def __require_samples(self) -> None:
+        if not self.__count:
+            raise ValueError("No samples available")
+
+
+def _expand_metrics(metrics: Iterable[str]) -> Iterator[str]:
+    for metric in metrics:
+        if metric == "ci":
+            yield "ci-lower"
+            yield "ci-upper"
+        else:
+            yield metric
+
+
+class StatsMixin(ToolkitMixin):
+    """
+    A toolkit mixin that registers summary statistics of large sample sets as
+    `NewCommand`s.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def statistics(
+        self,
+        label: str,
+        data: Iterable[Any] | StreamingStats,
+        metrics: Iterable[str] = ("mean", "median"),
+        confidence: float = 0.95,
+        comment: Any = None,
+        mathmode: bool = True,
+        unit: str = "",
+        str_format: str = ".2f",
+        spell_digits: DigitSettings = "c",
+        upcase_after_separator: bool = True,
+        to_file: Optional[SerTarget] = None,
+    ) -> Self:
+        """
+        DSL method to register a `NewCommand` per requested statistic.
+        The statistics are computed in a single pass over `data`, unless
+        `data` is an already populated (and possibly merged) `StreamingStats`.
+        Each command is labeled `<label> <metric>` (e.g., `runtime p95`), the
+        `ci` metric registers both `ci-lower` and `ci-upper`.
+        For documentation on the remaining arguments, see the `NewCommand`
+        constructor and `StreamingStats.metric`.
+        """
+        if isinstance(data, StreamingStats):
+            stats = data
+        else:
+            stats = StreamingStats().consume(data)
+
+        for metric in _expand_metrics(metrics):
+            self.add(
+                NewCommand(
+                    f"{label} {metric}",
+                    stats.metric(metric, confidence),
+                    comment,
+                    mathmode,
+                    unit,
+                    "d" if metric == "count" else str_format,
+                    spell_digits,
+                    upcase_after_separator,
+                    to_file,
+                )
+            )
+        return self
@@ -4,6 +4,7 @@ and labels.
 """
 
 import re
+from collections.abc import Iterable
 from typing import Literal
 
 DIGIT_LABELS = [
@@ -69,3 +70,67 @@ def make_tex_identifier(
     else:
         tex_identifier = re.sub(r"\d", "", tex_identifier)
     return tex_identifier
+
+
+TEX_SPECIAL_CHARS = {
+    "\\": r"\textbackslash{}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+}
+"""
+Characters with a special meaning in TeX and their escaped representation.
+"""
+
+_TEX_ESCAPE_TABLE = str.maketrans(TEX_SPECIAL_CHARS)
+
+_BATCH_SEPARATOR = "\0"
+
+
+def escape_tex(text: str) -> str:
+    """
+    Escapes all characters with a special meaning in TeX (see
+    `TEX_SPECIAL_CHARS`) so that the text is typeset verbatim.
+
+    Parameters
+    ----------
+    text : str
+        The string that should be escaped.
+
+    Returns
+    -------
+    str
+        The escaped string.
+    """
+    return text.translate(_TEX_ESCAPE_TABLE)
+
+
+def escape_tex_all(texts: Iterable[str]) -> list[str]:
+    """
+    Escapes many strings at once (see `escape_tex`).
+    The strings are joined and translated in a single pass, which avoids the
+    per-call overhead for large numbers of (short) strings.
+
+    Parameters
+    ----------
+    texts : Iterable[str]
+        The strings that should be escaped.
+
+    Returns
+    -------
+    list[str]
+        The escaped strings in the same order.
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+    joined = _BATCH_SEPARATOR.join(texts)
+    if joined.count(_BATCH_SEPARATOR) != len(texts) - 1:
+        return [escape_tex(text) for text in texts]
+    return escape_tex(joined).split(_BATCH_SEPARATOR)
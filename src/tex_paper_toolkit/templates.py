@@ -0,0 +1,181 @@
+"""
+Module for rendering TeX text (e.g., paragraphs or table rows) from templates.
+Placeholders use the syntax `<<name>>` or `<<name:format>>` so that they do not
+clash with TeX groups (`{...}`). Templates are compiled once into render
+functions that are cached by their contents.
+"""
+
+import re
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Optional, Self
+
+from tex_paper_toolkit.mixins import TexString, ToolkitMixin
+from tex_paper_toolkit.serialization import SerTarget
+
+PLACEHOLDER_PATTERN = re.compile(
+    r"<<\s*(?P<name>[A-Za-z_][\w.-]*)\s*(?::(?P<format>(?:(?!>>).)*))?>>"
+)
+"""
+Matches template placeholders, e.g., `<<speedup>>` or `<<speedup:.2f>>`.
+"""
+
+
+class TexTemplate:
+    """
+    A compiled TeX template. Rendering a template only performs the
+    substitution, the template source is parsed once upon construction.
+    """
+
+    def __init__(self, source: str) -> None:
+        """
+        Compiles the given template source.
+
+        Parameters
+        ----------
+        source : str
+            The template text, where `<<name>>` and `<<name:format>>`
+            placeholders are substituted with values upon rendering. The
+            optional format is a Python format specifier.
+        """
+        self.__source = source
+
+        names: list[str] = []
+        fmt_parts: list[str] = []
+        pos = 0
+        for match in PLACEHOLDER_PATTERN.finditer(source):
+            spec = match.group("format") or ""
+            if "{" in spec or "}" in spec:
+                raise ValueError("Invalid format specifier in template", spec)
+            fmt_parts.append(_escape_format(source[pos : match.start()]))
+            fmt_parts.append(f"{{{len(names)}:{spec}}}")
+            names.append(match.group("name"))
+            pos = match.end()
+        fmt_parts.append(_escape_format(source[pos:]))
+
+        self.__fields = tuple(names)
+        self.__render = _make_renderer("".join(fmt_parts), self.__fields)
+
+    @property
+    def source(self) -> str:
+        """
+        Returns the source text of this template.
+        """
+        return self.__source
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """
+        Returns the placeholder names in order of their occurrence.
+        """
+        return self.__fields
+
+    def render(self, values: Optional[Mapping[str, Any]] = None, **kwargs) -> str:
+        """
+        Renders this template with the given values.
+
+        Parameters
+        ----------
+        values : Mapping[str, Any] | None (default: None)
+            Maps placeholder names to their values.
+        kwargs : Any
+            Additional values that take precedence over `values`.
+
+        Returns
+        -------
+        str
+            The rendered TeX string.
+        """
+        if kwargs:
+            values = {**(values or {}), **kwargs}
+        return self.__render(values or {})
+
+    def render_many(
+        self, rows: Iterable[Mapping[str, Any]], separator: str = "\n"
+    ) -> str:
+        """
+        Renders this template once per row (e.g., for table rows) and joins
+        the results.
+
+        Parameters
+        ----------
+        rows : Iterable[Mapping[str, Any]]
+            The values for each rendering.
+        separator : str (default: "\\n")
+            The string that is inserted between the rendered rows.
+
+        Returns
+        -------
+        str
+            The joined rendered TeX strings.
+        """
+        return separator.join(map(self.__render, rows))
+
+
+def _escape_format(literal: str) -> str:
+    return literal.replace("{", "{{").replace("}", "}}")
+
+
+def _make_renderer(
+    fmt: str, fields: tuple[str, ...]
+) -> Callable[[Mapping[str, Any]], str]:
+    if not fields:
+        text = fmt.format()
+        return lambda _: text
+    if len(fields) == 1:
+        getter = itemgetter(fields[0])
+        return lambda values: fmt.format(getter(values))
+    getters = itemgetter(*fields)
+    return lambda values: fmt.format(*getters(values))
+
+
+@lru_cache(maxsize=256)
+def compile_template(source: str) -> TexTemplate:
+    """
+    Compiles the given template source, reusing previously compiled templates
+    with the same contents.
+
+    Parameters
+    ----------
+    source : str
+        The template text, see `TexTemplate`.
+
+    Returns
+    -------
+    TexTemplate
+        The compiled template.
+    """
+    return TexTemplate(source)
+
+
+class TemplateMixin(ToolkitMixin):
+    """
+    A toolkit mixin that enables generation of TeX text from templates.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def template(
+        self,
+        label: str,
+        template: str | TexTemplate,
+        values: Optional[Mapping[str, Any]] = None,
+        rows: Optional[Iterable[Mapping[str, Any]]] = None,
+        separator: str = "\n",
+        to_file: Optional[SerTarget] = None,
+    ) -> Self:
+        """
+        DSL method to register a `TexString` rendered from a template.
+        If `rows` are given, the template is rendered once per row and the
+        results are joined with `separator`, otherwise it is rendered once with
+        `values`.
+        For documentation on the template syntax, see `TexTemplate`.
+        """
+        if isinstance(template, str):
+            template = compile_template(template)
+        tex_str = (
+            template.render(values)
+            if rows is None
+            else template.render_many(rows, separator)
+        )
+        return self.add(TexString(label, tex_str, to_file))
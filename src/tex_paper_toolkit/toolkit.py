@@ -4,11 +4,13 @@ with the default mixins.
 """
 
 from collections import defaultdict
-from typing import Self
+from typing import Optional, Self
 from pathlib import Path
 from abc import ABCMeta
-from tex_paper_toolkit.serialization import Serializable
+from tex_paper_toolkit.serialization import Serializable, Serializer
 from tex_paper_toolkit.mixins import AnyStringMixin, NewCommandMixin, ToolkitMixin
+from tex_paper_toolkit.dataflow import DataflowGraph, DerivedMixin
+from tex_paper_toolkit.validation import TexValidationError, validate
 
 
 class TexToolkit(ToolkitMixin, metaclass=ABCMeta):
@@ -20,12 +22,19 @@ class TexToolkit(ToolkitMixin, metaclass=ABCMeta):
 
     def __init__(self) -> None:
         self._targets: dict[str, Serializable] = {}
+        self._dataflow = DataflowGraph(self._targets.get)
 
     def add(self, s: Serializable) -> Self:
+        self._dataflow.update(s)
         self._targets[s.id] = s
         return self
 
-    def serialize(self, to_file: str | Path) -> None:
+    def serialize(
+        self,
+        to_file: str | Path,
+        validate_output: bool = True,
+        jobs: Optional[int] = None,
+    ) -> None:
         """
         Serializes all registered `Serializable`s to the given output file or
         by using individually specified `Serializer`s.
@@ -35,6 +44,19 @@ class TexToolkit(ToolkitMixin, metaclass=ABCMeta):
         to_file : str | Path
             The file path to which the serialized components are written by
             default.
+        validate_output : bool (default: True)
+            Validates the TeX output of all files before anything is written
+            (see `validation.validate_file`).
+        jobs : int | None (default: None)
+            The number of processes used to validate the output files in
+            parallel. By default, validation runs in the current process. If
+            `jobs > 1`, the calling script must guard its entry point with
+            `if __name__ == "__main__":` (see `validation.validate`).
+
+        Raises
+        ------
+        TexValidationError
+            If the validation detects invalid TeX output.
         """
         path: Path = Path(to_file) if isinstance(to_file, str) else to_file
         if path.exists() and not path.is_file():
@@ -42,23 +64,35 @@ class TexToolkit(ToolkitMixin, metaclass=ABCMeta):
                 "Element at path", path, "exists and is not a writable file"
             )
 
-        target_locations = defaultdict[Path, list[Serializable]](list)
+        target_locations = defaultdict[Path, list[tuple[str, str]]](list)
+        serializers: list[tuple[Serializer, Serializable]] = []
 
-        for target in self._targets.values():
+        for target in self._dataflow.order(self._targets.values()):
             ser_target = target.get_path_or_default(path)
             if isinstance(ser_target, Path):
-                target_locations[ser_target].append(target)
+                target_locations[ser_target].append((target.id, target.serialize()))
             else:
-                ser_target(target)
+                serializers.append((ser_target, target))
+
+        if validate_output:
+            issues = validate(
+                {str(path): entries for path, entries in target_locations.items()},
+                jobs,
+            )
+            if issues:
+                raise TexValidationError(issues)
+
+        for serializer, target in serializers:
+            serializer(target)
 
         for path, entries in target_locations.items():
             with open(path, "w", encoding="UTF-8") as outfile:
-                for entry in entries:
-                    outfile.write(entry.serialize() + "\n")
+                for _, tex in entries:
+                    outfile.write(tex + "\n")
 
 
-class DefaultToolkit(NewCommandMixin, AnyStringMixin, TexToolkit):
+class DefaultToolkit(NewCommandMixin, DerivedMixin, AnyStringMixin, TexToolkit):
     """
     A default implementation of the `TexToolkit` that enables generation of
-    `\\newcommand` constants as well as arbitrary Tex strings.
+    (derived) `\\newcommand` constants as well as arbitrary Tex strings.
     """
@@ -0,0 +1,258 @@
+"""
+Module that validates serialized TeX output before it is written, so that
+common mistakes are reported with the offending `Serializable` instead of
+surfacing during the (much later) TeX build.
+"""
+
+import re
+from collections.abc import Mapping, Sequence
+from typing import NamedTuple, Optional
+
+RESERVED_MACROS = frozenset(
+    # accents and special letters
+    ["a", "b", "c", "d", "H", "i", "j", "k", "l", "L", "o", "O", "r", "t", "u", "v"]
+    + ["aa", "AA", "ae", "AE", "oe", "OE", "ss", "P", "S", "dh", "DH", "th", "TH"]
+    # kernel and document structure
+    + ["begin", "end", "def", "let", "relax", "par", "item", "input", "include"]
+    + ["newcommand", "renewcommand", "providecommand", "newenvironment"]
+    + ["documentclass", "usepackage", "label", "ref", "pageref", "cite", "caption"]
+    + ["part", "chapter", "section", "subsection", "subsubsection", "paragraph"]
+    + ["title", "author", "date", "today", "footnote", "url", "hline", "and"]
+    + ["text", "textbf", "textit", "texttt", "textrm", "textsf", "emph", "mbox"]
+    + ["hbox", "vbox", "box", "hfill", "vfill", "hspace", "vspace", "newline"]
+    + ["linebreak", "pagebreak", "newpage", "clearpage", "centering", "small"]
+    + ["large", "Large", "LARGE", "huge", "Huge", "tiny", "normalsize", "the"]
+    + ["if", "else", "fi", "or", "unless", "over", "atop", "choose", "line"]
+    # common math symbols and operators
+    + ["alpha", "beta", "gamma", "delta", "epsilon", "theta", "lambda", "mu"]
+    + ["pi", "rho", "sigma", "tau", "phi", "chi", "psi", "omega", "Delta", "Sigma"]
+    + ["sum", "prod", "int", "frac", "sqrt", "log", "ln", "exp", "min", "max"]
+    + ["sin", "cos", "tan", "lim", "inf", "sup", "det", "dim", "deg", "times"]
+    + ["cdot", "pm", "le", "ge", "leq", "geq", "ne", "neq", "infty", "to", "in"]
+    + ["mid", "left", "right", "mathrm", "mathbf", "mathit", "bar", "hat", "vec"]
+)
+"""
+Macros defined by (La)TeX itself that must not be redefined via `\\newcommand`.
+"""
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<define>\\newcommand\*?\s*
+        (?:\{\s*\\(?P<name>[^{}\s]*)\s*\}|\\(?P<bare>[A-Za-z@]+)))
+    |(?P<escaped>\\[\\{}$%&#_])
+    |(?P<comment>%[^\n]*)
+    |(?P<math>\$\$?|\\[()\[\]])
+    |(?P<open>\{)
+    |(?P<close>\})
+    """,
+    re.VERBOSE,
+)
+
+_MACRO_NAME = re.compile(r"[A-Za-z@]+")
+
+_MATH_DELIMITERS = {"$": "$", "$$": "$$", "\\(": "\\)", "\\[": "\\]"}
+
+
+class ValidationIssue(NamedTuple):
+    """
+    A problem detected in the serialized output of a `Serializable`.
+    """
+
+    entry_id: str
+    """The `Serializable.id` of the offending entry."""
+    path: str
+    """The output file the entry is written to."""
+    line: int
+    """The (1-based) line within the output file."""
+    message: str
+    """A description of the problem."""
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}: {self.entry_id}: {self.message}"
+
+
+class TexValidationError(ValueError):
+    """
+    Raised if the serialized output contains invalid TeX.
+    """
+
+    def __init__(self, issues: Sequence[ValidationIssue]) -> None:
+        super().__init__(
+            "\n".join(["Invalid TeX output:", *(str(issue) for issue in issues)])
+        )
+        self.issues = list(issues)
+
+
+FileEntries = Sequence[tuple[str, str]]
+"""
+The rendered entries of an output file as pairs of `Serializable.id` and the
+serialized TeX string.
+"""
+
+
+def _math_delimiter(
+    math: Optional[str], token: str
+) -> tuple[Optional[str], Optional[str]]:
+    if math is None and token in _MATH_DELIMITERS:
+        return _MATH_DELIMITERS[token], None
+    if math is None:
+        return None, f"'{token}' outside of math mode"
+    if token == math:
+        return None, None
+    return math, f"unexpected '{token}' in math mode"
+
+
+def _scan_entry(tex: str) -> tuple[list[tuple[int, str]], list[tuple[int, str]]]:
+    problems: list[tuple[int, str]] = []
+    definitions: list[tuple[int, str]] = []
+    depth = 0
+    math: Optional[str] = None
+    math_start = 0
+
+    for match in _TOKEN_PATTERN.finditer(tex):
+        kind = match.lastgroup
+        token = match.group()
+        if kind == "define":
+            definitions.append(
+                (match.start(), match.group("bare") or match.group("name"))
+            )
+        elif kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth -= 1
+            if depth < 0:
+                problems.append((match.start(), "unbalanced '}'"))
+                depth = 0
+        elif kind == "math":
+            if math is None:
+                math_start = match.start()
+            elif math == "$" and token == "$$":
+                # closes inline math and opens the next one (e.g., `$a$$b$`)
+                math_start = match.start() + 1
+                continue
+            math, problem = _math_delimiter(math, token)
+            if problem is not None:
+                problems.append((match.start(), problem))
+
+    if depth:
+        problems.append((len(tex), f"unbalanced braces ({depth} unclosed '{{')"))
+    if math is not None:
+        problems.append((math_start, f"unterminated math mode (missing '{math}')"))
+    return problems, definitions
+
+
+def _definition_problem(
+    name: str, defined: Mapping[str, tuple[str, int]]
+) -> Optional[str]:
+    if not name:
+        return "empty macro name in \\newcommand"
+    if not _MACRO_NAME.fullmatch(name):
+        return f"invalid macro name \\{name}"
+    if name in RESERVED_MACROS:
+        return f"redefinition of reserved macro \\{name}"
+    if name in defined:
+        other_id, other_line = defined[name]
+        return (
+            f"duplicate definition of \\{name} "
+            f"(already defined by {other_id} at line {other_line})"
+        )
+    return None
+
+
+def validate_file(
+    path: str, entries: FileEntries
+) -> tuple[list[ValidationIssue], dict[str, tuple[str, int]]]:
+    """
+    Validates the rendered entries of a single output file in one linear pass.
+    Each entry must have balanced braces and math mode delimiters. Macros
+    defined via `\\newcommand` must have valid, non-reserved and unique names.
+
+    Parameters
+    ----------
+    path : str
+        The output file (used for reporting).
+    entries : FileEntries
+        The rendered entries in output order.
+
+    Returns
+    -------
+    tuple[list[ValidationIssue], dict[str, tuple[str, int]]]
+        The detected issues and the defined macros with the defining entry id
+        and line.
+    """
+    issues: list[ValidationIssue] = []
+    defined: dict[str, tuple[str, int]] = {}
+    first_line = 1
+
+    for entry_id, tex in entries:
+        problems, definitions = _scan_entry(tex)
+        for pos, name in definitions:
+            line = first_line + tex.count("\n", 0, pos)
+            problem = _definition_problem(name, defined)
+            if problem is None:
+                defined[name] = (entry_id, line)
+            else:
+                issues.append(ValidationIssue(entry_id, path, line, problem))
+        for pos, problem in problems:
+            line = first_line + tex.count("\n", 0, pos)
+            issues.append(ValidationIssue(entry_id, path, line, problem))
+        first_line += tex.count("\n") + 1
+
+    return issues, defined
+
+
+def _validate_files(
+    files: Mapping[str, FileEntries], jobs: Optional[int]
+) -> list[tuple[list[ValidationIssue], dict[str, tuple[str, int]]]]:
+    if jobs is not None and min(jobs, len(files)) > 1:
+        # imported lazily as it is costly
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as executor:
+            return list(executor.map(validate_file, files, files.values()))
+    return [validate_file(path, entries) for path, entries in files.items()]
+
+
+def validate(
+    files: Mapping[str, FileEntries], jobs: Optional[int] = None
+) -> list[ValidationIssue]:
+    """
+    Validates the rendered output files (see `validate_file`) and additionally
+    detects macros that are defined in multiple files.
+
+    Parameters
+    ----------
+    files : Mapping[str, FileEntries]
+        The rendered entries per output file.
+    jobs : int | None (default: None)
+        The number of processes used to validate files in parallel. By default,
+        files are validated in the current process. Starting processes requires
+        the calling script to guard its entry point with
+        `if __name__ == "__main__":` on platforms that spawn processes (e.g.,
+        macOS or Windows).
+
+    Returns
+    -------
+    list[ValidationIssue]
+        All detected issues.
+    """
+    issues: list[ValidationIssue] = []
+    defined: dict[str, tuple[str, str]] = {}
+    for path, (file_issues, file_defined) in zip(files, _validate_files(files, jobs)):
+        issues.extend(file_issues)
+        for name, (entry_id, line) in file_defined.items():
+            if name in defined:
+                other_id, other_path = defined[name]
+                issues.append(
+                    ValidationIssue(
+                        entry_id,
+                        path,
+                        line,
+                        f"duplicate definition of \\{name} "
+                        f"(already defined by {other_id} in {other_path})",
+                    )
+                )
+            else:
+                defined[name] = (entry_id, path)
+    return issues
@@ -0,0 +1,150 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+import sys
+from pathlib import Path
+
+import pytest
+from utils import assert_file_content
+from tex_paper_toolkit.cli import load_jobs, main
+
+BUILD_SCRIPT = """
+from pathlib import Path
+from tex_paper_toolkit import DefaultToolkit
+
+
+def build():
+    tex = DefaultToolkit()
+    for line in Path("data/values.txt").read_text().splitlines():
+        label, value = line.split("=")
+        tex.newcommand(label, int(value))
+    return tex
+
+
+def fail():
+    raise RuntimeError("broken job")
+"""
+
+MODULE_SCRIPT = """
+from tex_paper_toolkit import DefaultToolkit
+
+VALUE = {value}
+
+
+def build():
+    return DefaultToolkit().newcommand("answer", VALUE)
+"""
+
+
+@pytest.fixture(name="project")
+def fixture_project(tmp_path: Path) -> Path:
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "values.txt").write_text("first=1\nsecond=2\n")
+    (tmp_path / "build.py").write_text(BUILD_SCRIPT)
+    (tmp_path / "pyproject.toml").write_text(
+        """
+[tool.tex_paper_toolkit.jobs.values]
+build = "build.py:build"
+output = "out/values.tex"
+inputs = ["data/*.txt"]
+
+[tool.tex_paper_toolkit.jobs.copy]
+build = "build.py:build"
+output = "out/copy.tex"
+"""
+    )
+    return tmp_path
+
+
+def test_load_jobs(project: Path):
+    (project / "jobs.toml").write_text(
+        'cache = "cache.json"\n[jobs.a]\nbuild = "mod:fn"\noutput = "a.tex"\n'
+    )
+    jobs, cache = load_jobs(project / "jobs.toml")
+    assert [(job.name, job.build, job.output, job.inputs) for job in jobs] == [
+        ("a", "mod:fn", project / "a.tex", ())
+    ]
+    assert cache == project / "cache.json"
+
+    jobs, cache = load_jobs(project / "pyproject.toml")
+    assert [job.name for job in jobs] == ["values", "copy"]
+    assert cache == project / ".tex_paper_toolkit_cache.json"
+
+
+@pytest.mark.parametrize("parallel", ["1", "2"])
+def test_main_runs_and_caches_jobs(
+    project: Path, parallel: str, capsys: pytest.CaptureFixture[str]
+):
+    config = str(project / "pyproject.toml")
+    expected = "\\newcommand{\\first}{$1$}\n\\newcommand{\\second}{$2$}\n"
+
+    assert main(["-c", config, "-j", parallel]) == 0
+    assert_file_content(project / "out" / "values.tex", expected)
+    assert_file_content(project / "out" / "copy.tex", expected)
+    out = capsys.readouterr().out
+    assert "values: done in" in out and "copy: done in" in out
+
+    assert main(["-c", config, "-j", parallel]) == 0
+    out = capsys.readouterr().out
+    assert "values: skipped (unchanged)" in out
+    assert "copy: skipped (unchanged)" in out
+
+    (project / "data" / "values.txt").write_text("first=3\n")
+    assert main(["-c", config, "-j", parallel]) == 0
+    out = capsys.readouterr().out
+    assert "values: done in" in out
+    assert "copy: skipped (unchanged)" in out
+    assert_file_content(project / "out" / "values.tex", "\\newcommand{\\first}{$3$}\n")
+
+    assert main(["-c", config, "--force", "copy"]) == 0
+    out = capsys.readouterr().out
+    assert "copy: done in" in out and "values" not in out
+
+
+def test_main_errors(project: Path, capsys: pytest.CaptureFixture[str]):
+    (project / "broken.toml").write_text(
+        '[jobs.broken]\nbuild = "build.py:fail"\noutput = "broken.tex"\n'
+    )
+    assert main(["-c", str(project / "broken.toml")]) == 1
+    assert "broken: failed (RuntimeError: broken job)" in capsys.readouterr().err
+    assert not (project / "broken.tex").exists()
+
+    assert main(["-c", str(project / "pyproject.toml"), "unknown"]) == 2
+    assert main(["-c", str(project / "missing.toml")]) == 2
+
+    (project / "nocolon.toml").write_text(
+        '[jobs.nocolon]\nbuild = "nocolon"\noutput = "nocolon.tex"\n'
+    )
+    assert main(["-c", str(project / "nocolon.toml")]) == 2
+    assert "Invalid build callable" in capsys.readouterr().err
+
+    (project / "absolute.toml").write_text(
+        '[jobs.absolute]\nbuild = "build.py:build"\noutput = "absolute.tex"\n'
+        f'inputs = ["{(project / "data").as_posix()}/*.txt"]\n'
+    )
+    assert main(["-c", str(project / "absolute.toml")]) == 2
+    assert "Invalid input pattern" in capsys.readouterr().err
+
+
+def test_main_reruns_changed_module_jobs(
+    project: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.setattr(sys, "modules", dict(sys.modules))
+    module = project / "cli_jobs" / "results.py"
+    module.parent.mkdir()
+    (module.parent / "__init__.py").write_text("")
+    module.write_text(MODULE_SCRIPT.format(value=1))
+    (project / "module.toml").write_text(
+        '[jobs.module]\nbuild = "cli_jobs.results:build"\noutput = "module.tex"\n'
+    )
+    config = str(project / "module.toml")
+
+    assert main(["-c", config]) == 0
+    assert main(["-c", config]) == 0
+    assert "module: skipped (unchanged)" in capsys.readouterr().out
+
+    module.write_text(MODULE_SCRIPT.format(value=42))
+    assert main(["-c", config]) == 0
+    assert "module: done in" in capsys.readouterr().out
+    assert_file_content(project / "module.tex", "\\newcommand{\\answer}{$42$}\n")
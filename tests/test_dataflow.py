@@ -0,0 +1,128 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+from utils import assert_file_content
+from tex_paper_toolkit import DefaultToolkit, DerivedCommand, NewCommand
+
+
+def counting(calls: list[str], name: str, function):
+    def wrapper(*args):
+        calls.append(name)
+        return function(*args)
+
+    return wrapper
+
+
+# pylint: disable=unused-argument
+def test_derived_serialize(fs: FakeFilesystem):
+    tex = DefaultToolkit()
+    tex.newcommand("baseline", 120)
+    tex.newcommand("optimized", 40)
+    tex.derived("speedup", lambda b, o: b / o, ["baseline", "optimized"], unit="x")
+    tex.derived(
+        "reduction",
+        lambda s: (1 - 1 / s) * 100,
+        ["speedup"],
+        str_format=".1f",
+        unit="\\%",
+    )
+
+    tex.serialize(to_file="derived.tex")
+
+    assert_file_content(
+        "derived.tex",
+        r"""\newcommand{\baseline}{$120$}
+\newcommand{\optimized}{$40$}
+\newcommand{\speedup}{$3.00x$}
+\newcommand{\reduction}{$66.7\%$}
+""",
+    )
+
+
+def test_derived_recomputes_affected_values():
+    calls = list[str]()
+    tex = DefaultToolkit()
+    tex.newcommand("a", 1)
+    tex.newcommand("b", 2)
+    tex.derived("x", counting(calls, "x", lambda a: a * 10), ["a"])
+    tex.derived("y", counting(calls, "y", lambda b: b * 10), ["b"])
+    z = DerivedCommand("z", counting(calls, "z", lambda x, y: x + y), ["x", "y"])
+    tex.derived("z", z.function, z.inputs, command=z)
+
+    assert z.value == 30
+    assert sorted(calls) == ["x", "y", "z"]
+
+    calls.clear()
+    assert z.value == 30
+    assert not calls
+
+    tex.newcommand("a", 5)
+    assert z.value == 70
+    assert sorted(calls) == ["x", "z"]
+
+
+# pylint: disable=unused-argument
+def test_derived_serialization_order(fs: FakeFilesystem):
+    tex = DefaultToolkit()
+    tex.derived("total", lambda x, y: x + y, ["first", "second"], str_format="d")
+    tex.newcommand("second", 2)
+    tex.texstring("text", "text")
+    tex.newcommand("first", 1)
+
+    tex.serialize(to_file="ordered.tex")
+
+    assert_file_content(
+        "ordered.tex",
+        r"""\newcommand{\first}{$1$}
+\newcommand{\second}{$2$}
+\newcommand{\total}{$3$}
+text
+""",
+    )
+
+
+def test_derived_replaced_by_constant():
+    tex = DefaultToolkit()
+    tex.newcommand("a", 1)
+    tex.derived("b", lambda a: a + 1, ["a"], str_format="d")
+    tex.derived("c", lambda b: b * 2, ["b"], str_format="d")
+    c = DerivedCommand("c", lambda b: b * 2, ["b"], str_format="d")
+    tex.add(c)
+    assert c.value == 4
+
+    tex.newcommand("b", 10)
+    assert c.value == 20
+
+
+class PercentCommand(NewCommand):
+    pass
+
+
+# pylint: disable=unused-argument
+def test_derived_from_command_subclass(fs: FakeFilesystem):
+    tex = DefaultToolkit()
+    tex.add(PercentCommand("share", 25))
+    tex.derived("rest", lambda share: 100 - share, ["share"], str_format="d")
+    tex.serialize(to_file="derived.tex")
+    assert_file_content(
+        "derived.tex", "\\newcommand{\\share}{$25$}\n\\newcommand{\\rest}{$75$}\n"
+    )
+
+
+def test_derived_errors():
+    tex = DefaultToolkit()
+    tex.derived("a", lambda b: b, ["b"])
+    with pytest.raises(ValueError):
+        tex.derived("b", lambda a: a, ["a"])
+    with pytest.raises(ValueError):
+        tex.derived("c", lambda c: c, ["c"])
+
+    missing = DerivedCommand("d", lambda e: e, ["e"])
+    with pytest.raises(ValueError):
+        _ = missing.value
+    tex.add(missing)
+    with pytest.raises(KeyError):
+        _ = missing.value
@@ -0,0 +1,53 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+import subprocess
+import sys
+
+import pytest
+import tex_paper_toolkit
+
+IMPORT_BUDGET_US = 25_000
+"""
+Maximum (cumulative) time in microseconds that `import tex_paper_toolkit` may
+take, excluding the interpreter startup.
+"""
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+
+
+def measure_import_us() -> int:
+    stderr = run_python("-X", "importtime", "-c", "import tex_paper_toolkit").stderr
+    for line in stderr.splitlines():
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.strip() == "tex_paper_toolkit":
+            return int(cumulative)
+    raise AssertionError("Import of tex_paper_toolkit not reported")
+
+
+def test_import_loads_no_submodules():
+    loaded = run_python(
+        "-c",
+        "import sys, tex_paper_toolkit; "
+        "print(' '.join(sorted(m for m in sys.modules if m.startswith('tex_paper'))))",
+    ).stdout.split()
+    assert loaded == ["tex_paper_toolkit", "tex_paper_toolkit.version"]
+
+
+def test_import_time_budget():
+    # take the best of multiple runs to reduce noise
+    assert min(measure_import_us() for _ in range(3)) < IMPORT_BUDGET_US
+
+
+def test_lazy_attributes():
+    assert tex_paper_toolkit.DefaultToolkit.__module__ == "tex_paper_toolkit.toolkit"
+    assert tex_paper_toolkit.cli.__name__ == "tex_paper_toolkit.cli"
+    assert set(tex_paper_toolkit.__all__) <= set(dir(tex_paper_toolkit))
+    for name in tex_paper_toolkit.__all__:
+        assert getattr(tex_paper_toolkit, name) is not None
+    with pytest.raises(AttributeError):
+        _ = tex_paper_toolkit.does_not_exist
@@ -0,0 +1,43 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+import pytest
+from tex_paper_toolkit.mixins import NewCommand, TexString
+
+
+def test_newcommand_serialize():
+    assert NewCommand("const", 3).serialize() == r"\newcommand{\const}{$3$}"
+    assert (
+        NewCommand("ratio", 0.5, "a_b", mathmode=False, str_format=".1f").serialize()
+        == r"\newcommand{\ratio}{0.5} % a_b"
+    )
+
+
+def test_newcommand_escape():
+    cmd = NewCommand(
+        "name", "bench_1", "50% of #runs", unit="\\,\\%", str_format="s", escape=True
+    )
+    assert cmd.serialize() == r"\newcommand{\name}{$bench\_1\,\%$} % 50\% of \#runs"
+
+    cmd = NewCommand(
+        "name", "bench_1", "a&b", str_format="s", unit="\\%", escape=["value"]
+    )
+    assert cmd.serialize() == r"\newcommand{\name}{$bench\_1\%$} % a&b"
+
+    cmd = NewCommand("name", 1, unit="a_b", mathmode=False, escape={"unit"})
+    assert cmd.serialize() == r"\newcommand{\name}{1a\_b}"
+
+
+def test_newcommand_escape_invalid_fields():
+    with pytest.raises(ValueError):
+        NewCommand("name", 1, escape=["valeu"])  # type: ignore[list-item]
+    with pytest.raises(ValueError):
+        NewCommand("name", 1, escape="value")  # type: ignore[arg-type]
+
+
+def test_texstring_escape():
+    assert TexString("raw", r"\emph{a_b}").serialize() == r"\emph{a_b}"
+    assert (
+        TexString("escaped", "a_b & {c}", escape=True).serialize() == r"a\_b \& \{c\}"
+    )
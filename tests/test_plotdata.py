@@ -0,0 +1,121 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=too-many-ancestors
+
+import math
+import os
+from pathlib import Path
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+from utils import assert_file_content
+from tex_paper_toolkit import DefaultToolkit
+from tex_paper_toolkit.plotdata import (
+    HEADER_PREFIX,
+    PlotData,
+    PlotDataMixin,
+    lttb,
+    minmax,
+)
+
+
+class PlotToolkit(PlotDataMixin, DefaultToolkit):
+    pass
+
+
+def wave(n: int) -> tuple[list[float], list[float]]:
+    xs = [float(i) for i in range(n)]
+    ys = [math.sin(i / 50) for i in range(n)]
+    ys[n // 3] = 10.0
+    ys[2 * n // 3] = -10.0
+    return xs, ys
+
+
+def test_small_series_unchanged():
+    assert lttb([0, 1, 2], [3, 4, 5], 10) == [0, 1, 2]
+    assert minmax([3, 4, 5], 10) == [0, 1, 2]
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_downsampling_preserves_shape(method):
+    xs, ys = wave(10_000)
+    indices = PlotData("w", "w.dat", xs, ys, 100, method).downsample()
+
+    assert len(indices) <= 100
+    assert indices == sorted(set(indices))
+    assert indices[0] == 0 and indices[-1] == len(xs) - 1
+    # spikes survive downsampling
+    assert len(xs) // 3 in indices
+    assert 2 * len(xs) // 3 in indices
+
+
+def test_minmax_keeps_bucket_extrema():
+    ys = [0, 5, 1, -3, 2, 7, 0, 4, 0, 1]
+    assert minmax(ys, 6) == [0, 1, 3, 5, 6, 9]
+
+
+def test_downsampling_errors():
+    with pytest.raises(ValueError):
+        lttb([0, 1, 2], [0, 1, 2], 2)
+    with pytest.raises(ValueError):
+        minmax([0, 1, 2, 3], 3)
+
+
+def test_plotdata_errors():
+    with pytest.raises(ValueError):
+        PlotData("p", "p.dat", [1, 2], [1])
+    with pytest.raises(ValueError):
+        PlotData("p", "p.dat", [1], [1], max_points=3)
+    with pytest.raises(ValueError):
+        PlotData("p", "p.dat", [1], [1], method="unknown")  # type: ignore[arg-type]
+
+
+def test_plotdata_serialize():
+    plot = PlotData("p", "p.dat", range(3), (v * 0.5 for v in range(3)), None)
+    assert plot.serialize() == "\n".join(
+        [f"{HEADER_PREFIX}{plot.input_hash}", "x y", "0.0 0", "1.0 0.5", "2.0 1"]
+    )
+    assert plot.input_hash != PlotData("p", "p.dat", range(3), range(3)).input_hash
+
+
+def test_plotdata_keeps_large_x_exact():
+    start = 1_700_000_000.25
+    xs = [1_000_006.0, 1_000_007.0] + [start + i for i in range(3)]
+    plot = PlotData("p", "p.dat", xs, [1 / 3] * 5, None)
+
+    rows = [row.split() for row in plot.serialize().splitlines()[2:]]
+    assert [float(x) for x, _ in rows] == xs
+    assert {y for _, y in rows} == {"0.333333"}
+
+    plot = PlotData("p", "p.dat", xs, [0] * 5, None, x_format=".6g")
+    assert plot.serialize().splitlines()[4] == "1.7e+09 0"
+
+
+# pylint: disable=unused-argument
+def test_plotdata_mixin_caches_output(fs: FakeFilesystem):
+    xs, ys = wave(5000)
+    tex = PlotToolkit()
+    tex.plotdata("trace", "plots/trace.dat", xs, ys, max_points=50, columns=("t", "v"))
+    tex.newcommand("points", len(xs))
+    tex.serialize(to_file="out.tex")
+
+    assert_file_content("out.tex", "\\newcommand{\\points}{$5000$}\n")
+    path = Path("plots/trace.dat")
+    lines = path.read_text(encoding="UTF-8").splitlines()
+    assert lines[0].startswith(HEADER_PREFIX)
+    assert lines[1] == "t v"
+    assert len(lines) == 52
+
+    # unchanged inputs do not rewrite the file
+    os.utime(path, ns=(0, 0))
+    tex = PlotToolkit()
+    tex.plotdata("trace", "plots/trace.dat", xs, ys, max_points=50, columns=("t", "v"))
+    tex.serialize(to_file="out.tex")
+    assert path.stat().st_mtime_ns == 0
+
+    ys[0] = 1.0
+    tex.plotdata("trace", "plots/trace.dat", xs, ys, max_points=50, columns=("t", "v"))
+    tex.serialize(to_file="out.tex")
+    assert path.stat().st_mtime_ns != 0
+    assert path.read_text(encoding="UTF-8").splitlines()[2] == "0.0 1"
@@ -0,0 +1,128 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=too-many-ancestors
+
+import random
+import statistics
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+from utils import assert_file_content
+from tex_paper_toolkit import DefaultToolkit
+from tex_paper_toolkit.stats import QuantileSketch, StatsMixin, StreamingStats
+
+
+class StatsToolkit(StatsMixin, DefaultToolkit):
+    pass
+
+
+def samples(n: int, seed: int = 42) -> list[float]:
+    rng = random.Random(seed)
+    return [rng.gauss(100, 15) for _ in range(n)]
+
+
+def test_sketch_exact_below_capacity():
+    sketch = QuantileSketch(capacity=16).update([4, 1, 3, 2])
+    assert sketch.count == 4
+    assert sketch.quantile(0) == 1
+    assert sketch.quantile(0.5) == 2.5
+    assert sketch.quantile(1) == 4
+
+
+def test_sketch_keeps_exact_count():
+    sketch = QuantileSketch(capacity=8).update(range(1001))
+    assert sketch.count == 1001
+    assert sketch.merge(QuantileSketch(capacity=8).update(range(99))).count == 1100
+
+
+def test_sketch_invalid_arguments():
+    with pytest.raises(ValueError):
+        QuantileSketch(capacity=1)
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(0.5)
+    with pytest.raises(ValueError):
+        QuantileSketch().update([1]).quantile(1.5)
+
+
+def test_stats_single_pass():
+    data = samples(50_000)
+    stats = StreamingStats().consume(iter(data), chunk_size=1000)
+    assert stats.count == len(data)
+    assert stats.mean == pytest.approx(statistics.fmean(data))
+    assert stats.stddev == pytest.approx(statistics.stdev(data))
+    assert stats.minimum == min(data)
+    assert stats.maximum == max(data)
+
+    ordered = sorted(data)
+    for q in (0.05, 0.5, 0.95, 0.99):
+        # rank error of the sketch is bounded
+        estimate = stats.quantile(q)
+        rank = sum(1 for v in ordered if v <= estimate)
+        assert abs(rank / len(data) - q) < 0.01
+
+
+def test_stats_chunks_and_merge():
+    data = samples(20_000)
+    whole = StreamingStats().consume(data)
+    chunked = StreamingStats().consume([data[:5000], data[5000:12000]])
+    worker = StreamingStats().consume([data[12000:]])
+    chunked.merge(worker).merge(StreamingStats())
+
+    assert chunked.count == whole.count
+    assert chunked.mean == pytest.approx(whole.mean)
+    assert chunked.variance == pytest.approx(whole.variance)
+    assert chunked.minimum == whole.minimum
+    assert chunked.maximum == whole.maximum
+    assert chunked.quantile(0.5) == pytest.approx(whole.quantile(0.5), rel=0.01)
+
+
+def test_stats_metrics():
+    stats = StreamingStats().update([1, 2, 3, 4, 5])
+    assert stats.metric("count") == 5
+    assert stats.metric("median") == 3
+    assert stats.metric("p25") == 2
+    assert stats.metric("min") == 1
+    assert stats.metric("max") == 5
+    assert stats.metric("variance") == pytest.approx(2.5)
+    lower, upper = stats.confidence_interval(0.95)
+    assert stats.metric("ci-lower") == lower < 3 < upper == stats.metric("ci-upper")
+    with pytest.raises(ValueError):
+        stats.metric("unknown")
+    with pytest.raises(ValueError):
+        StreamingStats().metric("mean")
+
+
+def test_stats_invalid_samples():
+    assert StreamingStats().consume([]).count == 0
+    with pytest.raises(TypeError):
+        StreamingStats().consume([None, 1])
+    with pytest.raises(TypeError):
+        StreamingStats().consume([1, None])
+
+
+# pylint: disable=unused-argument
+def test_stats_mixin(fs: FakeFilesystem):
+    tex = StatsToolkit()
+    tex.statistics(
+        "runtime", [[1, 2, 3], [4, 5]], metrics=("count", "mean", "p50", "max")
+    )
+    tex.statistics(
+        "speedup",
+        StreamingStats().update([2.0, 4.0]),
+        metrics=("ci",),
+        confidence=0.5,
+        mathmode=False,
+    )
+    tex.serialize(to_file="stats.tex")
+
+    assert_file_content(
+        "stats.tex",
+        r"""\newcommand{\RuntimeCount}{$5$}
+\newcommand{\RuntimeMean}{$3.00$}
+\newcommand{\RuntimePFiveZero}{$3.00$}
+\newcommand{\RuntimeMax}{$5.00$}
+\newcommand{\SpeedupCiLower}{2.33}
+\newcommand{\SpeedupCiUpper}{3.67}
+""",
+    )
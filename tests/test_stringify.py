@@ -2,7 +2,7 @@
 # pylint: disable=missing-class-docstring
 # pylint: disable=missing-function-docstring
 
-from tex_paper_toolkit.stringify import make_tex_identifier
+from tex_paper_toolkit.stringify import escape_tex, escape_tex_all, make_tex_identifier
 
 
 def test_make_tex_identifier_defaults():
@@ -42,3 +42,19 @@ def test_make_tex_identifier_all_options():
         )
         == "StringWithFivepFourcesSpeIalCharsADNumbThreers"
     )
+
+
+def test_escape_tex():
+    assert escape_tex("plain text") == "plain text"
+    assert escape_tex("bench_1 & 50% #2") == r"bench\_1 \& 50\% \#2"
+    assert escape_tex("{$x$}") == r"\{\$x\$\}"
+    assert (
+        escape_tex("a\\b~c^d")
+        == r"a\textbackslash{}b\textasciitilde{}c\textasciicircum{}d"
+    )
+
+
+def test_escape_tex_all():
+    assert not escape_tex_all([])
+    assert escape_tex_all(["a_b", "", "c%"]) == ["a\\_b", "", "c\\%"]
+    assert escape_tex_all(iter(["x\0y", "#"])) == ["x\0y", "\\#"]
@@ -0,0 +1,75 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+# pylint: disable=too-many-ancestors
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+from utils import assert_file_content
+from tex_paper_toolkit import DefaultToolkit
+from tex_paper_toolkit.templates import TemplateMixin, TexTemplate, compile_template
+
+
+class TemplateToolkit(TemplateMixin, DefaultToolkit):
+    pass
+
+
+def test_template_render():
+    template = TexTemplate(r"\textbf{<<name>>} is <<speedup:.1f>>$\times$ faster")
+    assert template.fields == ("name", "speedup")
+    assert (
+        template.render({"name": "fast"}, speedup=2.345)
+        == r"\textbf{fast} is 2.3$\times$ faster"
+    )
+
+
+def test_template_without_placeholders():
+    template = TexTemplate(r"\emph{{nested}} < a >")
+    assert not template.fields
+    assert template.render() == r"\emph{{nested}} < a >"
+
+
+def test_template_repeated_placeholders():
+    template = TexTemplate("<< x >>/<<y>>/<<x:03d>>")
+    assert template.render(x=7, y="y") == "7/y/007"
+
+
+def test_template_render_many():
+    template = TexTemplate(r"<<bench>> & <<time:.2f>> \\")
+    rows = [{"bench": "a", "time": 1}, {"bench": "b", "time": 2.5}]
+    assert template.render_many(rows) == "a & 1.00 \\\\\nb & 2.50 \\\\"
+    assert template.render_many([], separator=",") == ""
+
+
+def test_template_errors():
+    with pytest.raises(KeyError):
+        TexTemplate("<<missing>>").render()
+    with pytest.raises(ValueError):
+        TexTemplate("<<x:{y}>>")
+
+
+def test_compile_template_cached():
+    source = "<<a>> and <<b>>"
+    assert compile_template(source) is compile_template("<<a>> and " + "<<b>>")
+    assert compile_template(source) is not compile_template("<<a>>")
+
+
+# pylint: disable=unused-argument
+def test_template_mixin(fs: FakeFilesystem):
+    tex = TemplateToolkit()
+    tex.template("intro", r"We evaluate \emph{<<n>>} benchmarks.", {"n": 12})
+    tex.template(
+        "rows",
+        TexTemplate(r"<<name>> & <<value>> \\"),
+        rows=({"name": f"b{i}", "value": i} for i in range(3)),
+    )
+    tex.serialize(to_file="templates.tex")
+
+    assert_file_content(
+        "templates.tex",
+        r"""We evaluate \emph{12} benchmarks.
+b0 & 0 \\
+b1 & 1 \\
+b2 & 2 \\
+""",
+    )
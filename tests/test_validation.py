@@ -0,0 +1,115 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-class-docstring
+# pylint: disable=missing-function-docstring
+
+from pathlib import Path
+
+import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
+from tex_paper_toolkit import DefaultToolkit, TexValidationError
+from tex_paper_toolkit.validation import ValidationIssue, validate, validate_file
+
+
+def messages(issues: list[ValidationIssue]) -> list[tuple[str, int, str]]:
+    return [(issue.entry_id, issue.line, issue.message) for issue in issues]
+
+
+def test_validate_file_valid():
+    issues, defined = validate_file(
+        "out.tex",
+        [
+            ("a", r"\newcommand{\speedup}{$3.00\times$} % 50% {"),
+            ("b", "\\textbf{x}\\\\[2pt] \\{ $$a$$ \\(b\\) $a$$b$\n\\[c\\] \\$"),
+            ("c", r"\newcommand\other{1}"),
+        ],
+    )
+    assert not issues
+    assert defined == {"speedup": ("a", 1), "other": ("c", 4)}
+
+
+def test_validate_file_balance():
+    issues, _ = validate_file(
+        "out.tex",
+        [
+            ("a", r"\textbf{x"),
+            ("b", "x}\n{}"),
+            ("c", "$x"),
+            ("d", r"\(x$\)"),
+            ("e", r"x\]"),
+            ("f", "$x$$"),
+        ],
+    )
+    assert messages(issues) == [
+        ("a", 1, "unbalanced braces (1 unclosed '{')"),
+        ("b", 2, "unbalanced '}'"),
+        ("c", 4, "unterminated math mode (missing '$')"),
+        ("d", 5, "unexpected '$' in math mode"),
+        ("e", 6, "'\\]' outside of math mode"),
+        ("f", 7, "unterminated math mode (missing '$')"),
+    ]
+
+
+def test_validate_file_definitions():
+    issues, defined = validate_file(
+        "out.tex",
+        [
+            ("NewCommand:1", r"\newcommand{\}{$1$}"),
+            ("NewCommand:x", r"\newcommand{\x}{$1$}"),
+            ("NewCommand:section", "\n" + r"\newcommand{\section}{$1$}"),
+            ("NewCommand:y", r"\newcommand{\x}{$2$}"),
+            ("NewCommand:x1", r"\newcommand{\x1}{$2$}"),
+        ],
+    )
+    assert messages(issues) == [
+        ("NewCommand:1", 1, "empty macro name in \\newcommand"),
+        ("NewCommand:section", 4, "redefinition of reserved macro \\section"),
+        (
+            "NewCommand:y",
+            5,
+            "duplicate definition of \\x (already defined by NewCommand:x at line 2)",
+        ),
+        ("NewCommand:x1", 6, "invalid macro name \\x1"),
+    ]
+    assert defined == {"x": ("NewCommand:x", 2)}
+
+
+@pytest.mark.parametrize("jobs", [None, 1, 2])
+def test_validate_across_files(jobs):
+    issues = validate(
+        {
+            "a.tex": [("A:x", r"\newcommand{\x}{1}")],
+            "b.tex": [("B:y", r"\newcommand{\y}{2}"), ("B:x", r"\newcommand{\x}{3}")],
+            "c.tex": [("C:z", "{")],
+        },
+        jobs,
+    )
+    assert [str(issue) for issue in issues] == [
+        "b.tex:2: B:x: duplicate definition of \\x (already defined by A:x in a.tex)",
+        "c.tex:1: C:z: unbalanced braces (1 unclosed '{')",
+    ]
+
+
+# pylint: disable=unused-argument
+def test_serialize_validates_before_writing(fs: FakeFilesystem):
+    tex = DefaultToolkit()
+    written = list[str]()
+    tex.newcommand("valid", 1)
+    tex.newcommand("1", 1)
+    tex.texstring("broken", r"\textbf{x", to_file="other.tex")
+    tex.texstring("custom", "{", to_file=lambda s: written.append(s.serialize()))
+
+    with pytest.raises(TexValidationError) as error:
+        tex.serialize(to_file="out.tex")
+
+    assert [issue.entry_id for issue in error.value.issues] == [
+        "NewCommand:1",
+        "TexString:broken",
+    ]
+    assert "TexString:broken" in str(error.value)
+    assert not Path("out.tex").exists()
+    assert not Path("other.tex").exists()
+    assert not written
+
+    tex.serialize(to_file="out.tex", validate_output=False)
+    assert Path("out.tex").exists()
+    assert written == ["{"]